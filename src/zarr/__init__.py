@@ -1,41 +1,115 @@
+import importlib as _importlib
+import typing as _typing
+
+# ``zarr.core`` and ``zarr.codecs`` register the default buffer, codec pipeline and codec
+# implementations. Importing them first (in this order) keeps the registry import order acyclic.
+from zarr import core  # noqa: F401  # isort: skip
+from zarr import codecs  # noqa: F401  # isort: skip
 from zarr._version import version as __version__
-from zarr.api.synchronous import (
-    array,
-    consolidate_metadata,
-    copy,
-    copy_all,
-    copy_store,
-    create,
-    create_array,
-    create_group,
-    create_hierarchy,
-    empty,
-    empty_like,
-    full,
-    full_like,
-    group,
-    load,
-    ones,
-    ones_like,
-    open,
-    open_array,
-    open_consolidated,
-    open_group,
-    open_like,
-    save,
-    save_array,
-    save_group,
-    tree,
-    zeros,
-    zeros_like,
-)
-from zarr.core.array import Array, AsyncArray
 from zarr.core.config import config
-from zarr.core.group import AsyncGroup, Group
+
+if _typing.TYPE_CHECKING:
+    from zarr.api.synchronous import (
+        array,
+        consolidate_metadata,
+        copy,
+        copy_all,
+        copy_store,
+        create,
+        create_array,
+        create_group,
+        create_hierarchy,
+        empty,
+        empty_like,
+        full,
+        full_like,
+        group,
+        load,
+        ones,
+        ones_like,
+        open,
+        open_array,
+        open_consolidated,
+        open_group,
+        open_like,
+        save,
+        save_array,
+        save_group,
+        tree,
+        zeros,
+        zeros_like,
+    )
+    from zarr.core.array import Array, AsyncArray
+    from zarr.core.group import AsyncGroup, Group
 
 # in case setuptools scm screw up and find version to be 0.0.0
 assert not __version__.startswith("0.0.0")
 
+# Public names are resolved lazily (PEP 562) so that ``import zarr`` does not pay for
+# importing the array, group, codec and buffer machinery until it is actually used.
+_LAZY: dict[str, tuple[str, str]] = {
+    **{
+        name: ("zarr.api.synchronous", name)
+        for name in (
+            "array",
+            "consolidate_metadata",
+            "copy",
+            "copy_all",
+            "copy_store",
+            "create",
+            "create_array",
+            "create_group",
+            "create_hierarchy",
+            "empty",
+            "empty_like",
+            "full",
+            "full_like",
+            "group",
+            "load",
+            "ones",
+            "ones_like",
+            "open",
+            "open_array",
+            "open_consolidated",
+            "open_group",
+            "open_like",
+            "save",
+            "save_array",
+            "save_group",
+            "tree",
+            "zeros",
+            "zeros_like",
+        )
+    },
+    "Array": ("zarr.core.array", "Array"),
+    "AsyncArray": ("zarr.core.array", "AsyncArray"),
+    "AsyncGroup": ("zarr.core.group", "AsyncGroup"),
+    "Group": ("zarr.core.group", "Group"),
+}
+
+# Public subpackages that ``import zarr`` has always made reachable as attributes, e.g.
+# ``zarr.storage.MemoryStore`` or ``zarr.api.asynchronous.open``. They are imported on first
+# access; loading the synchronous API pulls in the same modules that ``import zarr`` used to.
+_SUBPACKAGES = frozenset({"abc", "api", "codecs", "core", "errors", "registry", "storage"})
+
+
+def __getattr__(name: str) -> _typing.Any:
+    if name in _SUBPACKAGES:
+        _importlib.import_module("zarr.api.synchronous")
+        return _importlib.import_module(f"{__name__}.{name}")
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(_importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*__all__, *_SUBPACKAGES, "config", "__version__"})
+
+
 __all__ = [
     "Array",
     "AsyncArray",
@@ -12,6 +12,8 @@ from zarr.abc.codec import ArrayBytesCodec
 from zarr.registry import get_ndbuffer_class
 
 if TYPE_CHECKING:
+    from typing import Any
+
     import numcodecs.abc
 
     from zarr.core.array_spec import ArraySpec
@@ -31,17 +33,12 @@ class V2Codec(ArrayBytesCodec):
         chunk_spec: ArraySpec,
     ) -> NDBuffer:
         cdata = chunk_bytes.as_array_like()
-        # decompress
-        if self.compressor:
-            chunk = await asyncio.to_thread(self.compressor.decode, cdata)
+        # decompress and apply filters
+        if self.compressor or self.filters:
+            chunk = await asyncio.to_thread(self._decode_chain, cdata)
         else:
             chunk = cdata
 
-        # apply filters
-        if self.filters:
-            for f in reversed(self.filters):
-                chunk = await asyncio.to_thread(f.decode, chunk)
-
         # view as numpy array with correct dtype
         chunk = ensure_ndarray_like(chunk)
         # special case object dtype, because incorrect handling can lead to
@@ -82,23 +79,44 @@ class V2Codec(ArrayBytesCodec):
         # ensure contiguous and correct order
         chunk = chunk.astype(chunk_spec.dtype, order=chunk_spec.order, copy=False)
 
+        # apply filters and compress
+        if self.compressor or self.filters:
+            cdata = await asyncio.to_thread(self._encode_chain, chunk)
+        else:
+            cdata = self._encode_chain(chunk)
+
+        cdata = ensure_bytes(cdata)
+        return chunk_spec.prototype.buffer.from_bytes(cdata)
+
+    def _decode_chain(self, cdata: Any) -> Any:
+        """
+        Decompress and unfilter a chunk in a single worker thread, rather than dispatching a
+        thread per codec, to amortize the per-chunk scheduling overhead.
+        """
+        # decompress
+        chunk = self.compressor.decode(cdata) if self.compressor else cdata
+
+        # apply filters
+        if self.filters:
+            for f in reversed(self.filters):
+                chunk = f.decode(chunk)
+        return chunk
+
+    def _encode_chain(self, chunk: Any) -> Any:
+        """
+        Filter and compress a chunk in a single worker thread; see ``_decode_chain``.
+        """
         # apply filters
         if self.filters:
             for f in self.filters:
-                chunk = await asyncio.to_thread(f.encode, chunk)
+                chunk = f.encode(chunk)
 
         # check object encoding
         if ensure_ndarray_like(chunk).dtype == object:
             raise RuntimeError("cannot write object array without object codec")
 
         # compress
-        if self.compressor:
-            cdata = await asyncio.to_thread(self.compressor.encode, chunk)
-        else:
-            cdata = chunk
-
-        cdata = ensure_bytes(cdata)
-        return chunk_spec.prototype.buffer.from_bytes(cdata)
+        return self.compressor.encode(chunk) if self.compressor else chunk
 
     def compute_encoded_size(self, _input_byte_length: int, _chunk_spec: ArraySpec) -> int:
         raise NotImplementedError
@@ -141,6 +141,13 @@ def parse_shapelike(data: int | Iterable[int]) -> tuple[int, ...]:
         msg = f"Expected an integer or an iterable of integers. Got {data} instead."
         raise TypeError(msg) from e
 
+    # fast path: a single pass for the common case of non-negative python ints
+    for v in data_tuple:
+        if type(v) is not int or v < 0:
+            break
+    else:
+        return data_tuple
+
     if not all(isinstance(v, int) for v in data_tuple):
         msg = f"Expected an iterable of integers. Got {data} instead."
         raise TypeError(msg)
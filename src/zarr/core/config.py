@@ -32,9 +32,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 from donfig import Config as DConfig
+from donfig.config_obj import ConfigSet as DConfigSet
+from donfig.config_obj import no_default
 
 if TYPE_CHECKING:
-    from donfig.config_obj import ConfigSet
+    from collections.abc import Mapping
 
 
 class BadConfigError(ValueError):
@@ -53,12 +55,69 @@ class Config(DConfig):  # type: ignore[misc]
     -  Treats ``__`` (double-underscore) as nested access
     -  Calls ``ast.literal_eval`` on the value
 
+    Values returned by ``get`` are cached until the configuration changes.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._cache: dict[str, Any] = {}
+        super().__init__(*args, **kwargs)
+
+    def _invalidate(self) -> None:
+        with self.config_lock:
+            self._cache.clear()
+
+    def get(self, key: str, default: Any = no_default) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        with self.config_lock:
+            try:
+                value = super().get(key)
+            except (TypeError, IndexError, KeyError):
+                if default is no_default:
+                    raise
+                return default
+            self._cache[key] = value
+        return value
+
     def reset(self) -> None:
         self.clear()
         self.refresh()
 
+    def refresh(self, **kwargs: Any) -> None:
+        super().refresh(**kwargs)
+        self._invalidate()
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate()
+
+    def update(self, new: Mapping[str, Any], priority: str = "new") -> None:
+        super().update(new, priority=priority)
+        self._invalidate()
+
+    def update_defaults(self, new: Mapping[str, Any]) -> None:
+        super().update_defaults(new)
+        self._invalidate()
+
+    def merge(self, *dicts: Mapping[str, Any]) -> None:
+        super().merge(*dicts)
+        self._invalidate()
+
+    def expand_environment_variables(self) -> None:
+        super().expand_environment_variables()
+        self._invalidate()
+
+    def rename(self, aliases: Mapping[str, str]) -> None:
+        super().rename(aliases)
+        self._invalidate()
+
+    def set(self, arg: Mapping[str, Any] | None = None, **kwargs: Any) -> ConfigSet:
+        config_set = ConfigSet(self, arg=arg, **kwargs)
+        self._invalidate()
+        return config_set
+
     def enable_gpu(self) -> ConfigSet:
         """
         Configure Zarr to use GPUs where possible.
@@ -68,6 +127,21 @@ class Config(DConfig):  # type: ignore[misc]
         )
 
 
+class ConfigSet(DConfigSet):  # type: ignore[misc]
+    """
+    A donfig ``ConfigSet`` that invalidates the owning ``Config`` when the context manager exits
+    and the previous values are restored.
+    """
+
+    def __init__(self, owner: Config, arg: Mapping[str, Any] | None = None, **kwargs: Any) -> None:
+        self._owner = owner
+        super().__init__(owner.config, owner.config_lock, owner.deprecations, arg=arg, **kwargs)
+
+    def __exit__(self, *args: object) -> None:
+        super().__exit__(*args)
+        self._owner._invalidate()
+
+
 # The default configuration for zarr
 config = Config(
     "zarr",
@@ -15,7 +15,6 @@ import numpy as np
 import numpy.typing as npt
 from typing_extensions import deprecated
 
-import zarr.api.asynchronous as async_api
 from zarr._compat import _deprecate_positional_args
 from zarr.abc.metadata import Metadata
 from zarr.abc.store import Store, set_or_delete
@@ -33,7 +32,7 @@ from zarr.core.array import (
     create_array,
 )
 from zarr.core.attributes import Attributes
-from zarr.core.buffer import default_buffer_prototype
+from zarr.core.buffer.cpu import buffer_prototype as cpu_buffer_prototype
 from zarr.core.common import (
     JSON,
     ZARR_JSON,
@@ -506,7 +505,7 @@ class AsyncGroup:
                 paths.append(store_path / consolidated_key)
 
             zgroup_bytes, zattrs_bytes, *rest = await asyncio.gather(
-                *[path.get() for path in paths]
+                *[path.get(prototype=cpu_buffer_prototype) for path in paths]
             )
             if zgroup_bytes is None:
                 raise FileNotFoundError(store_path)
@@ -518,7 +517,7 @@ class AsyncGroup:
                 maybe_consolidated_metadata_bytes = None
 
         elif zarr_format == 3:
-            zarr_json_bytes = await (store_path / ZARR_JSON).get()
+            zarr_json_bytes = await (store_path / ZARR_JSON).get(prototype=cpu_buffer_prototype)
             if zarr_json_bytes is None:
                 raise FileNotFoundError(store_path)
         elif zarr_format is None:
@@ -528,10 +527,10 @@ class AsyncGroup:
                 zattrs_bytes,
                 maybe_consolidated_metadata_bytes,
             ) = await asyncio.gather(
-                (store_path / ZARR_JSON).get(),
-                (store_path / ZGROUP_JSON).get(),
-                (store_path / ZATTRS_JSON).get(),
-                (store_path / str(consolidated_key)).get(),
+                (store_path / ZARR_JSON).get(prototype=cpu_buffer_prototype),
+                (store_path / ZGROUP_JSON).get(prototype=cpu_buffer_prototype),
+                (store_path / ZATTRS_JSON).get(prototype=cpu_buffer_prototype),
+                (store_path / str(consolidated_key)).get(prototype=cpu_buffer_prototype),
             )
             if zarr_json_bytes is not None and zgroup_bytes is not None:
                 # warn and favor v3
@@ -780,7 +779,7 @@ class AsyncGroup:
             return default
 
     async def _save_metadata(self, ensure_parents: bool = False) -> None:
-        to_save = self.metadata.to_buffer_dict(default_buffer_prototype())
+        to_save = self.metadata.to_buffer_dict(cpu_buffer_prototype)
         awaitables = [set_or_delete(self.store_path / key, value) for key, value in to_save.items()]
 
         if ensure_parents:
@@ -790,7 +789,7 @@ class AsyncGroup:
                     [
                         (parent.store_path / key).set_if_not_exists(value)
                         for key, value in parent.metadata.to_buffer_dict(
-                            default_buffer_prototype()
+                            cpu_buffer_prototype
                         ).items()
                     ]
                 )
@@ -1960,7 +1959,7 @@ class Group(SyncMixin):
         new_metadata = replace(self.metadata, attributes=new_attributes)
 
         # Write new metadata
-        to_save = new_metadata.to_buffer_dict(default_buffer_prototype())
+        to_save = new_metadata.to_buffer_dict(cpu_buffer_prototype)
         awaitables = [set_or_delete(self.store_path / key, value) for key, value in to_save.items()]
         await asyncio.gather(*awaitables)
 
@@ -3367,7 +3366,7 @@ async def _read_metadata_v3(store: Store, path: str) -> ArrayV3Metadata | GroupM
     FileNotFoundError.
     """
     zarr_json_bytes = await store.get(
-        _join_paths([path, ZARR_JSON]), prototype=default_buffer_prototype()
+        _join_paths([path, ZARR_JSON]), prototype=cpu_buffer_prototype
     )
     if zarr_json_bytes is None:
         raise FileNotFoundError(path)
@@ -3385,9 +3384,9 @@ async def _read_metadata_v2(store: Store, path: str) -> ArrayV2Metadata | GroupM
     # TODO: consider first fetching array metadata, and only fetching group metadata when we don't
     # find an array
     zarray_bytes, zgroup_bytes, zattrs_bytes = await asyncio.gather(
-        store.get(_join_paths([path, ZARRAY_JSON]), prototype=default_buffer_prototype()),
-        store.get(_join_paths([path, ZGROUP_JSON]), prototype=default_buffer_prototype()),
-        store.get(_join_paths([path, ZATTRS_JSON]), prototype=default_buffer_prototype()),
+        store.get(_join_paths([path, ZARRAY_JSON]), prototype=cpu_buffer_prototype),
+        store.get(_join_paths([path, ZGROUP_JSON]), prototype=cpu_buffer_prototype),
+        store.get(_join_paths([path, ZATTRS_JSON]), prototype=cpu_buffer_prototype),
     )
 
     if zattrs_bytes is None:
@@ -3606,7 +3605,7 @@ def _persist_metadata(
     Prepare to save a metadata document to storage, returning a tuple of coroutines that must be awaited.
     """
 
-    to_save = metadata.to_buffer_dict(default_buffer_prototype())
+    to_save = metadata.to_buffer_dict(cpu_buffer_prototype)
     return tuple(
         _set_return_key(store=store, key=_join_paths([path, key]), value=value, semaphore=semaphore)
         for key, value in to_save.items()
@@ -3640,3 +3639,7 @@ async def create_rooted_hierarchy(
         x async for x in create_hierarchy(store=store, nodes=nodes, overwrite=overwrite)
     ]
     return dict(nodes_created)[root_key]
+
+
+# zarr.api.asynchronous imports this module, so it is imported last to avoid a circular import
+import zarr.api.asynchronous as async_api
@@ -2,16 +2,16 @@ from __future__ import annotations
 
 import base64
 import warnings
-from collections.abc import Iterable
 from enum import Enum
-from functools import cached_property
-from typing import TYPE_CHECKING, TypedDict, cast
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, ClassVar, TypedDict, cast
 
 import numcodecs.abc
 
 from zarr.abc.metadata import Metadata
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from typing import Any, Literal, Self
 
     import numpy.typing as npt
@@ -20,7 +20,7 @@ if TYPE_CHECKING:
     from zarr.core.common import ChunkCoords
 
 import json
-from dataclasses import dataclass, field, fields, replace
+from dataclasses import dataclass, field, fields
 
 import numcodecs
 import numpy as np
@@ -55,6 +55,9 @@ class ArrayV2Metadata(Metadata):
     attributes: dict[str, JSON] = field(default_factory=dict)
     zarr_format: Literal[2] = field(init=False, default=2)
 
+    # the keys accepted by ``from_dict``, set after the class is defined
+    _EXPECTED_KEYS: ClassVar[frozenset[str]]
+
     def __init__(
         self,
         *,
@@ -82,15 +85,19 @@ class ArrayV2Metadata(Metadata):
         fill_value_parsed = parse_fill_value(fill_value, dtype=dtype_parsed)
         attributes_parsed = parse_attributes(attributes)
 
-        object.__setattr__(self, "shape", shape_parsed)
-        object.__setattr__(self, "dtype", dtype_parsed)
-        object.__setattr__(self, "chunks", chunks_parsed)
-        object.__setattr__(self, "compressor", compressor_parsed)
-        object.__setattr__(self, "order", order_parsed)
-        object.__setattr__(self, "dimension_separator", dimension_separator_parsed)
-        object.__setattr__(self, "filters", filters_parsed)
-        object.__setattr__(self, "fill_value", fill_value_parsed)
-        object.__setattr__(self, "attributes", attributes_parsed)
+        # the dataclass is frozen, so the parsed fields are written straight into the
+        # instance dict in one step rather than with one object.__setattr__ call per field
+        self.__dict__.update(
+            shape=shape_parsed,
+            dtype=dtype_parsed,
+            chunks=chunks_parsed,
+            compressor=compressor_parsed,
+            order=order_parsed,
+            dimension_separator=dimension_separator_parsed,
+            filters=filters_parsed,
+            fill_value=fill_value_parsed,
+            attributes=attributes_parsed,
+        )
 
         # ensure that the metadata document is consistent
         _ = parse_metadata(self)
@@ -117,13 +124,7 @@ class ArrayV2Metadata(Metadata):
                 else:
                     return o.descr
             if isinstance(o, numcodecs.abc.Codec):
-                codec_config = o.get_config()
-
-                # Hotfix for https://github.com/zarr-developers/zarr-python/issues/2647
-                if codec_config["id"] == "zstd" and not codec_config.get("checksum", False):
-                    codec_config.pop("checksum", None)
-
-                return codec_config
+                return _codec_config(o)
             if np.isscalar(o):
                 out: Any
                 if hasattr(o, "dtype") and o.dtype.kind == "M" and hasattr(o, "view"):
@@ -147,6 +148,8 @@ class ArrayV2Metadata(Metadata):
 
         zarray_dict = self.to_dict()
         zattrs_dict = zarray_dict.pop("attributes", {})
+        zarray_dict["compressor"] = self._compressor_config
+        zarray_dict["filters"] = self._filters_config
         json_indent = config.get("json_indent")
         return {
             ZARRAY_JSON: prototype.buffer.from_bytes(
@@ -168,17 +171,9 @@ class ArrayV2Metadata(Metadata):
         if dtype.kind in "SV":
             fill_value_encoded = _data.get("fill_value")
             if fill_value_encoded is not None:
-                fill_value = base64.standard_b64decode(fill_value_encoded)
+                fill_value = _b64decode(fill_value_encoded)
                 _data["fill_value"] = fill_value
 
-        # zarr v2 allowed arbitrary keys here.
-        # We don't want the ArrayV2Metadata constructor to fail just because someone put an
-        # extra key in the metadata.
-        expected = {x.name for x in fields(cls)}
-        # https://github.com/zarr-developers/zarr-python/issues/2269
-        # handle the renames
-        expected |= {"dtype", "chunks"}
-
         # check if `filters` is an empty sequence; if so use None instead and raise a warning
         if _data["filters"] is not None and len(_data["filters"]) == 0:
             msg = (
@@ -189,7 +184,10 @@ class ArrayV2Metadata(Metadata):
             warnings.warn(msg, UserWarning, stacklevel=1)
             _data["filters"] = None
 
-        _data = {k: v for k, v in _data.items() if k in expected}
+        # zarr v2 allowed arbitrary keys here.
+        # We don't want the ArrayV2Metadata constructor to fail just because someone put an
+        # extra key in the metadata.
+        _data = {k: v for k, v in _data.items() if k in cls._EXPECTED_KEYS}
 
         return cls(**_data)
 
@@ -204,37 +202,104 @@ class ArrayV2Metadata(Metadata):
             zarray_dict["fill_value"] = fill_value
 
         _ = zarray_dict.pop("dtype")
-        dtype_json: JSON
+        zarray_dict["dtype"] = self._dtype_json
+
+        return zarray_dict
+
+    # The JSON representations below are derived from immutable fields, so they are computed
+    # once per instance instead of on every serialization.
+
+    @cached_property
+    def _dtype_json(self) -> JSON:
         # In the case of zarr v2, the simplest i.e., '|VXX' dtype is represented as a string
         dtype_descr = self.dtype.descr
         if self.dtype.kind == "V" and dtype_descr[0][0] != "" and len(dtype_descr) != 0:
-            dtype_json = tuple(self.dtype.descr)
-        else:
-            dtype_json = self.dtype.str
-        zarray_dict["dtype"] = dtype_json
+            return tuple(dtype_descr)
+        return self.dtype.str
 
-        return zarray_dict
+    @cached_property
+    def _compressor_config(self) -> dict[str, JSON] | None:
+        if self.compressor is None:
+            return None
+        return _codec_config(self.compressor)
+
+    @cached_property
+    def _filters_config(self) -> tuple[dict[str, JSON], ...] | None:
+        if self.filters is None:
+            return None
+        return tuple(_codec_config(f) for f in self.filters)
+
+    @cached_property
+    def _chunk_specs(self) -> dict[tuple[ArrayConfig, BufferPrototype], ArraySpec]:
+        return {}
 
     def get_chunk_spec(
         self, _chunk_coords: ChunkCoords, array_config: ArrayConfig, prototype: BufferPrototype
     ) -> ArraySpec:
-        return ArraySpec(
-            shape=self.chunks,
-            dtype=self.dtype,
-            fill_value=self.fill_value,
-            config=array_config,
-            prototype=prototype,
-        )
+        # Every chunk of a v2 array has the same spec, so it is built once per
+        # (array_config, prototype) instead of once per chunk.
+        key = (array_config, prototype)
+        try:
+            return self._chunk_specs[key]
+        except KeyError:
+            spec = ArraySpec(
+                shape=self.chunks,
+                dtype=self.dtype,
+                fill_value=self.fill_value,
+                config=array_config,
+                prototype=prototype,
+            )
+            self._chunk_specs[key] = spec
+            return spec
 
     def encode_chunk_key(self, chunk_coords: ChunkCoords) -> str:
-        chunk_identifier = self.dimension_separator.join(map(str, chunk_coords))
+        sep = self.dimension_separator
+        # this is called once per chunk, so the common low-dimensional cases are formatted
+        # directly instead of going through map + join
+        ndim = len(chunk_coords)
+        if ndim == 1:
+            return f"{chunk_coords[0]}"
+        if ndim == 2:
+            return f"{chunk_coords[0]}{sep}{chunk_coords[1]}"
+        if ndim == 3:
+            return f"{chunk_coords[0]}{sep}{chunk_coords[1]}{sep}{chunk_coords[2]}"
+        chunk_identifier = sep.join(map(str, chunk_coords))
         return "0" if chunk_identifier == "" else chunk_identifier
 
     def update_shape(self, shape: ChunkCoords) -> Self:
-        return replace(self, shape=shape)
+        new = self._unsafe_copy(shape=parse_shapelike(shape))
+        # only the shape changed, so only the shape / chunks consistency needs to be checked
+        _ = parse_metadata(new)
+        return new
 
     def update_attributes(self, attributes: dict[str, JSON]) -> Self:
-        return replace(self, attributes=attributes)
+        return self._unsafe_copy(attributes=parse_attributes(attributes))
+
+    def _unsafe_copy(self, **changes: Any) -> Self:
+        """
+        Copy this metadata, replacing the fields in ``changes``, without re-running the
+        parsers in ``__init__``. The caller is responsible for passing already-parsed values.
+        """
+        new = object.__new__(type(self))
+        new.__dict__.update({f.name: getattr(self, f.name) for f in fields(self)}, **changes)
+        return new
+
+
+# https://github.com/zarr-developers/zarr-python/issues/2269
+# handle the renames
+ArrayV2Metadata._EXPECTED_KEYS = frozenset({x.name for x in fields(ArrayV2Metadata)}) | {
+    "dtype",
+    "chunks",
+}
+
+
+@lru_cache(maxsize=128)
+def _b64decode(data: str) -> bytes:
+    """
+    Decode a base64-encoded fill value. Arrays in a hierarchy tend to share fill values, so
+    the decoded bytes are cached.
+    """
+    return base64.standard_b64decode(data)
 
 
 def parse_dtype(data: npt.DTypeLike) -> np.dtype[Any]:
@@ -253,29 +318,31 @@ def parse_filters(data: object) -> tuple[numcodecs.abc.Codec, ...] | None:
     """
     Parse a potential tuple of filters
     """
-    out: list[numcodecs.abc.Codec] = []
-
     if data is None:
         return data
-    if isinstance(data, Iterable):
-        for idx, val in enumerate(data):
-            if isinstance(val, numcodecs.abc.Codec):
-                out.append(val)
-            elif isinstance(val, dict):
-                out.append(numcodecs.get_codec(val))
-            else:
-                msg = f"Invalid filter at index {idx}. Expected a numcodecs.abc.Codec or a dict representation of numcodecs.abc.Codec. Got {type(val)} instead."
-                raise TypeError(msg)
-        if len(out) == 0:
-            # Per the v2 spec, an empty tuple is not allowed -- use None to express "no filters"
-            return None
-        else:
-            return tuple(out)
     # take a single codec instance and wrap it in a tuple
     if isinstance(data, numcodecs.abc.Codec):
         return (data,)
-    msg = f"Invalid filters. Expected None, an iterable of numcodecs.abc.Codec or dict representations of numcodecs.abc.Codec. Got {type(data)} instead."
-    raise TypeError(msg)
+    # probe with iter() rather than isinstance(data, Iterable), which goes through the
+    # comparatively slow ABC instance check
+    try:
+        it = iter(data)  # type: ignore[call-overload]
+    except TypeError:
+        msg = f"Invalid filters. Expected None, an iterable of numcodecs.abc.Codec or dict representations of numcodecs.abc.Codec. Got {type(data)} instead."
+        raise TypeError(msg) from None
+    out: list[numcodecs.abc.Codec] = []
+    for idx, val in enumerate(it):
+        if isinstance(val, numcodecs.abc.Codec):
+            out.append(val)
+        elif isinstance(val, dict):
+            out.append(numcodecs.get_codec(val))
+        else:
+            msg = f"Invalid filter at index {idx}. Expected a numcodecs.abc.Codec or a dict representation of numcodecs.abc.Codec. Got {type(val)} instead."
+            raise TypeError(msg)
+    if len(out) == 0:
+        # Per the v2 spec, an empty tuple is not allowed -- use None to express "no filters"
+        return None
+    return tuple(out)
 
 
 def parse_compressor(data: object) -> numcodecs.abc.Codec | None:
@@ -300,6 +367,19 @@ def parse_metadata(data: ArrayV2Metadata) -> ArrayV2Metadata:
     return data
 
 
+# numpy dtype kinds (boolean, signed / unsigned integer, floating point, complex) whose fill
+# values can be built with the scalar type constructor
+_SCALAR_KINDS = frozenset("biufc")
+
+
+@lru_cache(maxsize=64)
+def _zero_scalar(dtype_str: str) -> Any:
+    """
+    Get the (immutable) zero scalar of a dtype, so that it is only allocated once per dtype.
+    """
+    return np.zeros((), dtype=dtype_str)[()]
+
+
 def parse_fill_value(fill_value: object, dtype: np.dtype[Any]) -> Any:
     """
     Parse a potential fill value into a value that is compatible with the provided dtype.
@@ -319,10 +399,26 @@ def parse_fill_value(fill_value: object, dtype: np.dtype[Any]) -> Any:
     if fill_value is None or dtype.hasobject:
         # no fill value
         pass
+    elif dtype.kind in _SCALAR_KINDS:
+        # the scalar type constructor gives the same result as ``np.array(fill_value, dtype)[()]``
+        # without allocating an array. Zero fill values, including ``-0.0``, are normalized to
+        # the zero of the dtype.
+        try:
+            if fill_value == 0:
+                fill_value = _zero_scalar(dtype.str)
+            else:
+                fill_value = dtype.type(fill_value)
+        except (TypeError, ValueError, OverflowError) as e:
+            msg = f"Fill_value {fill_value} is not valid for dtype {dtype}."
+            raise ValueError(msg) from e
     elif not isinstance(fill_value, np.void) and fill_value == 0:
         # this should be compatible across numpy versions for any array type, including
         # structured arrays
-        fill_value = np.zeros((), dtype=dtype)[()]
+        if dtype.kind == "V":
+            # void scalars are mutable views into the array they came from, so they are not shared
+            fill_value = np.zeros((), dtype=dtype)[()]
+        else:
+            fill_value = _zero_scalar(dtype.str)
 
     elif dtype.kind == "U":
         # special case unicode because of encoding issues on Windows if passed through numpy
@@ -347,6 +443,19 @@ def parse_fill_value(fill_value: object, dtype: np.dtype[Any]) -> Any:
     return fill_value
 
 
+def _codec_config(codec: numcodecs.abc.Codec) -> dict[str, JSON]:
+    """
+    Get the JSON representation of a numcodecs codec.
+    """
+    codec_config: dict[str, JSON] = codec.get_config()
+
+    # Hotfix for https://github.com/zarr-developers/zarr-python/issues/2647
+    if codec_config["id"] == "zstd" and not codec_config.get("checksum", False):
+        codec_config.pop("checksum", None)
+
+    return codec_config
+
+
 def _default_fill_value(dtype: np.dtype[Any]) -> Any:
     """
     Get the default fill value for a type.
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from typing import Self
 
+    from zarr.codecs.sharding import ShardingCodec
     from zarr.core.buffer import Buffer, BufferPrototype
     from zarr.core.chunk_grids import ChunkGrid
     from zarr.core.common import JSON, ChunkCoords
@@ -18,6 +19,7 @@ import json
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import cache
 from typing import Any, Literal, cast
 
 import numcodecs.abc
@@ -93,9 +95,20 @@ def validate_array_bytes_codec(codecs: tuple[Codec, ...]) -> ArrayBytesCodec:
     return abcs[0]
 
 
+@cache
+def _sharding_codec_class() -> type[ShardingCodec]:
+    """
+    Get the ``ShardingCodec`` class. It cannot be imported at module level because of a
+    circular import, and importing it on every call is slow on hot paths.
+    """
+    from zarr.codecs.sharding import ShardingCodec
+
+    return ShardingCodec
+
+
 def validate_codecs(codecs: tuple[Codec, ...], dtype: DataType) -> None:
     """Check that the codecs are valid for the given dtype"""
-    from zarr.codecs.sharding import ShardingCodec
+    ShardingCodec = _sharding_codec_class()
 
     abc = validate_array_bytes_codec(codecs)
 
@@ -330,7 +343,7 @@ class ArrayV3Metadata(Metadata):
     @property
     def chunks(self) -> ChunkCoords:
         if isinstance(self.chunk_grid, RegularChunkGrid):
-            from zarr.codecs.sharding import ShardingCodec
+            ShardingCodec = _sharding_codec_class()
 
             if len(self.codecs) == 1 and isinstance(self.codecs[0], ShardingCodec):
                 sharding_codec = self.codecs[0]
@@ -348,7 +361,7 @@ class ArrayV3Metadata(Metadata):
     @property
     def shards(self) -> ChunkCoords | None:
         if isinstance(self.chunk_grid, RegularChunkGrid):
-            from zarr.codecs.sharding import ShardingCodec
+            ShardingCodec = _sharding_codec_class()
 
             if len(self.codecs) == 1 and isinstance(self.codecs[0], ShardingCodec):
                 return self.chunk_grid.chunk_shape
@@ -364,7 +377,7 @@ class ArrayV3Metadata(Metadata):
     @property
     def inner_codecs(self) -> tuple[Codec, ...]:
         if isinstance(self.chunk_grid, RegularChunkGrid):
-            from zarr.codecs.sharding import ShardingCodec
+            ShardingCodec = _sharding_codec_class()
 
             if len(self.codecs) == 1 and isinstance(self.codecs[0], ShardingCodec):
                 return self.codecs[0].codecs
@@ -581,14 +594,7 @@ def parse_fill_value(
 
 
 def default_fill_value(dtype: DataType) -> str | bytes | np.generic:
-    if dtype == DataType.string:
-        return ""
-    elif dtype == DataType.bytes:
-        return b""
-    else:
-        np_dtype = dtype.to_numpy()
-        np_dtype = cast(np.dtype[Any], np_dtype)
-        return np_dtype.type(0)  # type: ignore[misc]
+    return _DEFAULT_FILL_VALUES[dtype]
 
 
 # For type checking
@@ -615,64 +621,22 @@ class DataType(Enum):
 
     @property
     def byte_count(self) -> int | None:
-        data_type_byte_counts = {
-            DataType.bool: 1,
-            DataType.int8: 1,
-            DataType.int16: 2,
-            DataType.int32: 4,
-            DataType.int64: 8,
-            DataType.uint8: 1,
-            DataType.uint16: 2,
-            DataType.uint32: 4,
-            DataType.uint64: 8,
-            DataType.float16: 2,
-            DataType.float32: 4,
-            DataType.float64: 8,
-            DataType.complex64: 8,
-            DataType.complex128: 16,
-        }
-        try:
-            return data_type_byte_counts[self]
-        except KeyError:
-            # string and bytes have variable length
-            return None
+        # string and bytes have variable length
+        return _DATA_TYPE_BYTE_COUNTS.get(self)
 
     @property
     def has_endianness(self) -> _bool:
         return self.byte_count is not None and self.byte_count != 1
 
     def to_numpy_shortname(self) -> str:
-        data_type_to_numpy = {
-            DataType.bool: "bool",
-            DataType.int8: "i1",
-            DataType.int16: "i2",
-            DataType.int32: "i4",
-            DataType.int64: "i8",
-            DataType.uint8: "u1",
-            DataType.uint16: "u2",
-            DataType.uint32: "u4",
-            DataType.uint64: "u8",
-            DataType.float16: "f2",
-            DataType.float32: "f4",
-            DataType.float64: "f8",
-            DataType.complex64: "c8",
-            DataType.complex128: "c16",
-        }
-        return data_type_to_numpy[self]
+        return _DATA_TYPE_TO_NUMPY_SHORTNAME[self]
 
     def to_numpy(self) -> np.dtypes.StringDType | np.dtypes.ObjectDType | np.dtype[Any]:
         # note: it is not possible to round trip DataType <-> np.dtype
         # due to the fact that DataType.string and DataType.bytes both
         # generally return np.dtype("O") from this function, even though
         # they can originate as fixed-length types (e.g. "<U10", "|S5")
-        if self == DataType.string:
-            return STRING_NP_DTYPE
-        elif self == DataType.bytes:
-            # for now always use object dtype for bytestrings
-            # TODO: consider whether we can use fixed-width types (e.g. '|S5') instead
-            return np.dtype("O")
-        else:
-            return np.dtype(self.to_numpy_shortname())
+        return _DATA_TYPE_TO_NUMPY[self]
 
     @classmethod
     def from_numpy(cls, dtype: np.dtype[Any]) -> DataType:
@@ -684,24 +648,7 @@ class DataType(Enum):
             # numpy < 2.0 does not support vlen string dtype
             # so we fall back on object array of strings
             return DataType.string
-        dtype_to_data_type = {
-            "|b1": "bool",
-            "bool": "bool",
-            "|i1": "int8",
-            "<i2": "int16",
-            "<i4": "int32",
-            "<i8": "int64",
-            "|u1": "uint8",
-            "<u2": "uint16",
-            "<u4": "uint32",
-            "<u8": "uint64",
-            "<f2": "float16",
-            "<f4": "float32",
-            "<f8": "float64",
-            "<c8": "complex64",
-            "<c16": "complex128",
-        }
-        return DataType[dtype_to_data_type[dtype.str]]
+        return _NUMPY_STR_TO_DATA_TYPE[dtype.str]
 
     @classmethod
     def parse(cls, dtype: DataType | Any | None) -> DataType:
@@ -709,17 +656,99 @@ class DataType(Enum):
             return DataType[DEFAULT_DTYPE]
         if isinstance(dtype, DataType):
             return dtype
-        try:
-            return DataType(dtype)
-        except ValueError:
-            pass
-        try:
-            dtype = np.dtype(dtype)
-        except (ValueError, TypeError) as e:
-            raise ValueError(f"Invalid Zarr format 3 data_type: {dtype}") from e
+        if not isinstance(dtype, np.dtype):
+            # numpy dtypes skip the lookup by enum value: they are not hashed like the string
+            # values, so the lookup falls back to comparing them against every member
+            try:
+                return DataType(dtype)
+            except ValueError:
+                pass
+            try:
+                dtype = np.dtype(dtype)
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"Invalid Zarr format 3 data_type: {dtype}") from e
         # check that this is a valid v3 data_type
         try:
             data_type = DataType.from_numpy(dtype)
         except KeyError as e:
             raise ValueError(f"Invalid Zarr format 3 data_type: {dtype}") from e
         return data_type
+
+
+# The lookup tables below are used on every dtype conversion, so they are built once rather
+# than on every call.
+
+_DATA_TYPE_BYTE_COUNTS: dict[DataType, int] = {
+    DataType.bool: 1,
+    DataType.int8: 1,
+    DataType.int16: 2,
+    DataType.int32: 4,
+    DataType.int64: 8,
+    DataType.uint8: 1,
+    DataType.uint16: 2,
+    DataType.uint32: 4,
+    DataType.uint64: 8,
+    DataType.float16: 2,
+    DataType.float32: 4,
+    DataType.float64: 8,
+    DataType.complex64: 8,
+    DataType.complex128: 16,
+}
+
+_DATA_TYPE_TO_NUMPY_SHORTNAME: dict[DataType, str] = {
+    DataType.bool: "bool",
+    DataType.int8: "i1",
+    DataType.int16: "i2",
+    DataType.int32: "i4",
+    DataType.int64: "i8",
+    DataType.uint8: "u1",
+    DataType.uint16: "u2",
+    DataType.uint32: "u4",
+    DataType.uint64: "u8",
+    DataType.float16: "f2",
+    DataType.float32: "f4",
+    DataType.float64: "f8",
+    DataType.complex64: "c8",
+    DataType.complex128: "c16",
+}
+
+_DATA_TYPE_TO_NUMPY: dict[
+    DataType, np.dtypes.StringDType | np.dtypes.ObjectDType | np.dtype[Any]
+] = {
+    **{
+        data_type: np.dtype(shortname)
+        for data_type, shortname in _DATA_TYPE_TO_NUMPY_SHORTNAME.items()
+    },
+    DataType.string: STRING_NP_DTYPE,
+    # for now always use object dtype for bytestrings
+    # TODO: consider whether we can use fixed-width types (e.g. '|S5') instead
+    DataType.bytes: np.dtype("O"),
+}
+
+_NUMPY_STR_TO_DATA_TYPE: dict[str, DataType] = {
+    "|b1": DataType.bool,
+    "bool": DataType.bool,
+    "|i1": DataType.int8,
+    "<i2": DataType.int16,
+    "<i4": DataType.int32,
+    "<i8": DataType.int64,
+    "|u1": DataType.uint8,
+    "<u2": DataType.uint16,
+    "<u4": DataType.uint32,
+    "<u8": DataType.uint64,
+    "<f2": DataType.float16,
+    "<f4": DataType.float32,
+    "<f8": DataType.float64,
+    "<c8": DataType.complex64,
+    "<c16": DataType.complex128,
+}
+
+# the default fill values are immutable scalars, so they are shared rather than built per array
+_DEFAULT_FILL_VALUES: dict[DataType, str | bytes | np.generic] = {
+    **{
+        data_type: np.dtype(shortname).type(0)
+        for data_type, shortname in _DATA_TYPE_TO_NUMPY_SHORTNAME.items()
+    },
+    DataType.string: "",
+    DataType.bytes: b"",
+}
@@ -21,10 +21,12 @@ def cast_array(
     raise NotImplementedError
 
 
-try:
-    # this new vlen string dtype was added in NumPy 2.0
+# this new vlen string dtype was added in NumPy 2.0; checking the namespace directly avoids
+# the exception raised by the attribute lookup on older versions
+_NUMPY_SUPPORTS_VLEN_STRING = "StringDType" in vars(np.dtypes)
+
+if _NUMPY_SUPPORTS_VLEN_STRING:
     _STRING_DTYPE = np.dtypes.StringDType()
-    _NUMPY_SUPPORTS_VLEN_STRING = True
 
     def cast_array(
         data: np.ndarray[Any, np.dtype[Any]],
@@ -32,10 +34,9 @@ try:
         out = data.astype(_STRING_DTYPE, copy=False)
         return cast(np.ndarray[Any, np.dtypes.StringDType], out)
 
-except AttributeError:
+else:
     # if not available, we fall back on an object array of strings, as in Zarr < 3
     _STRING_DTYPE = np.dtypes.ObjectDType()
-    _NUMPY_SUPPORTS_VLEN_STRING = False
 
     def cast_array(
         data: np.ndarray[Any, np.dtype[Any]],
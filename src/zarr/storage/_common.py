@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any, Literal
 
 from zarr.abc.store import ByteRequest, Store
 from zarr.core.buffer import Buffer, default_buffer_prototype
+from zarr.core.buffer.cpu import buffer_prototype as cpu_buffer_prototype
 from zarr.core.common import ZARR_JSON, ZARRAY_JSON, ZGROUP_JSON, AccessModeLiteral, ZarrFormat
 from zarr.errors import ContainsArrayAndGroupError, ContainsArrayError, ContainsGroupError
 from zarr.storage._local import LocalStore
@@ -388,7 +389,7 @@ async def _contains_node_v3(store_path: StorePath) -> Literal["array", "group",
         A string representing the zarr node found at store_path.
     """
     result: Literal["array", "group", "nothing"] = "nothing"
-    extant_meta_bytes = await (store_path / ZARR_JSON).get()
+    extant_meta_bytes = await (store_path / ZARR_JSON).get(prototype=cpu_buffer_prototype)
     # if no metadata document could be loaded, then we just return "nothing"
     if extant_meta_bytes is not None:
         try:
@@ -452,7 +453,7 @@ async def contains_array(store_path: StorePath, zarr_format: ZarrFormat) -> bool
 
     """
     if zarr_format == 3:
-        extant_meta_bytes = await (store_path / ZARR_JSON).get()
+        extant_meta_bytes = await (store_path / ZARR_JSON).get(prototype=cpu_buffer_prototype)
         if extant_meta_bytes is None:
             return False
         else:
@@ -489,7 +490,7 @@ async def contains_group(store_path: StorePath, zarr_format: ZarrFormat) -> bool
 
     """
     if zarr_format == 3:
-        extant_meta_bytes = await (store_path / ZARR_JSON).get()
+        extant_meta_bytes = await (store_path / ZARR_JSON).get(prototype=cpu_buffer_prototype)
         if extant_meta_bytes is None:
             return False
         else:
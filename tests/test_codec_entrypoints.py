@@ -10,13 +10,14 @@ from zarr import config
 here = os.path.abspath(os.path.dirname(__file__))
 
 
-@pytest.fixture
+# scanning the installed entry points is comparatively slow, so it is done once for the
+# module; the config is reset around every test by the autouse reset_config fixture
+@pytest.fixture(scope="module")
 def set_path() -> Generator[None, None, None]:
     sys.path.append(here)
-    zarr.registry._collect_entrypoints()
+    registries = zarr.registry._collect_entrypoints()
     yield
     sys.path.remove(here)
-    registries = zarr.registry._collect_entrypoints()
     for registry in registries:
         registry.lazy_load_list.clear()
     config.reset()
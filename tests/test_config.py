@@ -121,6 +121,24 @@ def test_config_defaults_can_be_overridden(key: str, old_val: Any, new_val: Any)
         assert config.get(key) == new_val
 
 
+def test_config_get_cache() -> None:
+    assert config.get("json_indent") == 2
+    with config.set({"json_indent": 0}):
+        assert config.get("json_indent") == 0
+    assert config.get("json_indent") == 2
+    assert config.get("does.not.exist", None) is None
+    with pytest.raises(KeyError):
+        config.get("does.not.exist")
+
+
+def test_config_rename() -> None:
+    with config.set({"old_json_indent": 4}):
+        assert config.get("old_json_indent") == 4
+        config.rename({"old_json_indent": "new_json_indent"})
+        assert config.get("old_json_indent", None) is None
+        assert config.get("new_json_indent") == 4
+
+
 def test_fully_qualified_name() -> None:
     class MockClass:
         pass
@@ -21,7 +21,7 @@ from zarr import Array, AsyncArray, AsyncGroup, Group
 from zarr.abc.store import Store
 from zarr.core import sync_group
 from zarr.core._info import GroupInfo
-from zarr.core.buffer import default_buffer_prototype
+from zarr.core.buffer import Buffer, BufferPrototype, cpu, default_buffer_prototype
 from zarr.core.config import config as zarr_config
 from zarr.core.group import (
     ConsolidatedMetadata,
@@ -38,9 +38,11 @@ from zarr.core.group import (
 from zarr.core.metadata.v3 import ArrayV3Metadata
 from zarr.core.sync import _collect_aiterator, sync
 from zarr.errors import ContainsArrayError, ContainsGroupError, MetadataValidationError
+from zarr.registry import fully_qualified_name, register_buffer
 from zarr.storage import LocalStore, MemoryStore, StorePath, ZipStore
 from zarr.storage._common import make_store_path
 from zarr.storage._utils import _join_paths, normalize_path
+from zarr.testing.buffer import TestBuffer
 from zarr.testing.store import LatencyStore
 
 from .conftest import meta_from_array, parse_store
@@ -2066,3 +2068,48 @@ def test_get_roots(roots: tuple[str, ...]):
     }
     data = root_nodes | child_nodes
     assert set(_get_roots(data)) == set(roots)
+
+
+class BufferRecordingStore(MemoryStore):
+    """
+    A MemoryStore that records the buffer class of every value written and of every prototype
+    used to read.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.buffer_types: dict[str, set[type[Buffer]]] = {}
+
+    async def set(self, key: str, value: Buffer, byte_range: tuple[int, int] | None = None) -> None:
+        self.buffer_types.setdefault(key, set()).add(type(value))
+        await super().set(key, value, byte_range)
+
+    async def get(
+        self,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: Any = None,
+    ) -> Buffer | None:
+        self.buffer_types.setdefault(key, set()).add(prototype.buffer)
+        return await super().get(key, prototype=prototype, byte_range=byte_range)
+
+
+@pytest.mark.parametrize("zarr_format", [2, 3])
+def test_group_metadata_uses_cpu_buffer(zarr_format: ZarrFormat) -> None:
+    """
+    Test that group metadata documents are written and read as cpu.Buffer, even when a different
+    buffer class is configured.
+    """
+    store = BufferRecordingStore()
+    register_buffer(TestBuffer)
+    with zarr_config.set({"buffer": fully_qualified_name(TestBuffer)}):
+        create_hierarchy(store=store, nodes={"a": GroupMetadata(zarr_format=zarr_format)})
+        root = zarr.create_group(store=store, zarr_format=zarr_format)
+        root.create_group("b/c")
+        root.attrs.update({"foo": 10})
+        root.update_attributes({"bar": 10})
+        group = zarr.open_group(store=store, path="b/c", mode="r", zarr_format=zarr_format)
+        assert group.path == "b/c"
+    assert len(store.buffer_types) > 0
+    for key, types in store.buffer_types.items():
+        assert types == {cpu.Buffer}, (key, types)
@@ -8,11 +8,18 @@ import pytest
 
 import zarr.api.asynchronous
 import zarr.storage
+from zarr.core.array_spec import ArrayConfig
 from zarr.core.buffer import cpu
 from zarr.core.buffer.core import default_buffer_prototype
+from zarr.core.config import config
 from zarr.core.group import ConsolidatedMetadata, GroupMetadata
 from zarr.core.metadata import ArrayV2Metadata
-from zarr.core.metadata.v2 import parse_zarr_format
+from zarr.core.metadata.v2 import (
+    parse_compressor,
+    parse_fill_value,
+    parse_filters,
+    parse_zarr_format,
+)
 
 if TYPE_CHECKING:
     from typing import Any
@@ -316,3 +323,197 @@ def test_zstd_checksum() -> None:
         arr.metadata.to_buffer_dict(default_buffer_prototype())[".zarray"].to_bytes()
     )
     assert "checksum" not in metadata["compressor"]
+
+
+def test_json_indent() -> None:
+    """
+    Test that changes to the ``json_indent`` config are picked up by ``to_buffer_dict``.
+    """
+    metadata = ArrayV2Metadata(shape=(1,), dtype="i4", chunks=(1,), fill_value=0, order="C")
+    for indent in (2, 4, None, 2):
+        with config.set({"json_indent": indent}):
+            observed = metadata.to_buffer_dict(default_buffer_prototype())[".zarray"].to_bytes()
+            assert observed == json.dumps(json.loads(observed), indent=indent).encode()
+
+
+@pytest.mark.parametrize("fill_value", [np.nan, np.inf, -np.inf, 1.5])
+def test_to_buffer_dict_float_fill_value(fill_value: float) -> None:
+    """
+    Test that non-finite float fill values are written as NaN / Infinity, and not null.
+    """
+    metadata = ArrayV2Metadata(
+        shape=(1,), dtype="f8", chunks=(1,), fill_value=fill_value, order="C"
+    )
+    observed = metadata.to_buffer_dict(default_buffer_prototype())[".zarray"].to_bytes()
+    assert np.array_equal(json.loads(observed)["fill_value"], fill_value, equal_nan=True)
+
+
+def test_update_shape_and_attributes() -> None:
+    metadata = ArrayV2Metadata(
+        shape=(10, 10),
+        dtype="i4",
+        chunks=(5, 5),
+        fill_value=0,
+        order="C",
+        compressor=numcodecs.Zstd(),
+        attributes={"foo": "bar"},
+    )
+    assert metadata.update_shape((20, 10)) == ArrayV2Metadata(
+        shape=(20, 10),
+        dtype="i4",
+        chunks=(5, 5),
+        fill_value=0,
+        order="C",
+        compressor=numcodecs.Zstd(),
+        attributes={"foo": "bar"},
+    )
+    assert metadata.update_attributes({"baz": 1}).attributes == {"baz": 1}
+    assert metadata.attributes == {"foo": "bar"}
+    with pytest.raises(ValueError, match="must have the same length"):
+        metadata.update_shape((20,))
+
+
+@pytest.mark.parametrize("dimension_separator", [".", "/"])
+@pytest.mark.parametrize("chunk_coords", [(), (1,), (1, 2), (1, 2, 3), (1, 2, 3, 4)])
+def test_encode_chunk_key(
+    chunk_coords: tuple[int, ...], dimension_separator: Literal[".", "/"]
+) -> None:
+    metadata = ArrayV2Metadata(
+        shape=(10,) * len(chunk_coords),
+        dtype="i4",
+        chunks=(1,) * len(chunk_coords),
+        fill_value=0,
+        order="C",
+        dimension_separator=dimension_separator,
+    )
+    expected = dimension_separator.join(map(str, chunk_coords)) or "0"
+    assert metadata.encode_chunk_key(chunk_coords) == expected
+
+
+def test_get_chunk_spec() -> None:
+    """
+    Test that every chunk shares one chunk spec per (array_config, prototype).
+    """
+    metadata = ArrayV2Metadata(
+        shape=(4, 4),
+        dtype="uint8",
+        chunks=(2, 2),
+        fill_value=1,
+        order="C",
+    )
+    prototype = default_buffer_prototype()
+    array_config = ArrayConfig.from_dict({})
+    spec = metadata.get_chunk_spec((0, 0), array_config, prototype)
+    assert spec.shape == (2, 2)
+    assert spec.dtype == np.dtype("uint8")
+    assert spec.fill_value == 1
+    assert metadata.get_chunk_spec((1, 1), array_config, prototype) is spec
+    other_config = ArrayConfig.from_dict({"order": "F"})
+    other_spec = metadata.get_chunk_spec((1, 1), other_config, prototype)
+    assert other_spec is not spec
+    assert other_spec.config == other_config
+
+
+@pytest.mark.parametrize("dtype_str", ["bool", "i1", "u8", ">i4", "f2", ">f8", "c16"])
+@pytest.mark.parametrize("fill_value", [0, 1, 1.5, "NaN", True, np.int64(5)])
+def test_parse_fill_value_scalar(fill_value: Any, dtype_str: str) -> None:
+    """
+    Test that parse_fill_value returns the same scalar as casting via a numpy array.
+    """
+    dtype = np.dtype(dtype_str)
+    try:
+        expected = np.array(fill_value, dtype=dtype)[()]
+    except ValueError:
+        with pytest.raises(ValueError, match="is not valid for dtype"):
+            parse_fill_value(fill_value, dtype)
+        return
+    observed = parse_fill_value(fill_value, dtype)
+    assert type(observed) is type(expected)
+    assert np.array_equal(observed, expected, equal_nan=True)
+
+
+@pytest.mark.parametrize("dtype_str", ["f2", ">f4", "f8", "c8", "c16"])
+def test_parse_fill_value_negative_zero(dtype_str: str) -> None:
+    """
+    Test that a fill value of ``-0.0`` is normalized to positive zero.
+    """
+    observed = parse_fill_value(-0.0, np.dtype(dtype_str))
+    assert observed == 0
+    assert not np.signbit(np.real(observed))
+
+
+@pytest.mark.parametrize(("fill_value", "dtype_str"), [(2**70, "i8"), ("abc", "f8"), ("abc", "i4")])
+def test_parse_fill_value_scalar_invalid(fill_value: Any, dtype_str: str) -> None:
+    with pytest.raises(ValueError, match="is not valid for dtype"):
+        parse_fill_value(fill_value, np.dtype(dtype_str))
+
+
+@pytest.mark.parametrize("dtype_str", ["<M8[ns]", "<m8[s]", "|S4", "<U2"])
+def test_parse_fill_value_zero(dtype_str: str) -> None:
+    """
+    Test that a zero fill value resolves to the zero scalar of the dtype, and that the scalar
+    is shared between calls.
+    """
+    dtype = np.dtype(dtype_str)
+    observed = parse_fill_value(0, dtype)
+    assert observed == np.zeros((), dtype=dtype)[()]
+    assert parse_fill_value(0, dtype) is observed
+
+
+def test_parse_fill_value_zero_structured() -> None:
+    """
+    Test that the zero fill value of a structured dtype is not shared between calls, because
+    void scalars are mutable.
+    """
+    dtype = np.dtype([("a", "i4"), ("b", "f8")])
+    observed = parse_fill_value(0, dtype)
+    assert observed.dtype == dtype
+    assert parse_fill_value(0, dtype) is not observed
+
+
+def test_parse_compressor() -> None:
+    """
+    Test that equal codec configurations resolve to equal but independent codec instances,
+    and that configurations with unhashable values are supported.
+    """
+    a = parse_compressor({"id": "blosc", "cname": "lz4", "clevel": 5, "shuffle": 1})
+    b = parse_compressor({"id": "blosc", "cname": "lz4", "clevel": 5, "shuffle": 1})
+    assert a == b
+    a.clevel = 9
+    assert b.clevel == 5
+    assert parse_compressor({"id": "zstd", "level": 1, "checksum": 0}).get_config() == {
+        "id": "zstd",
+        "level": 1,
+        "checksum": 0,
+    }
+    filters = parse_filters([{"id": "categorize", "labels": ["a", "b"], "dtype": "<U1"}])
+    assert filters == (numcodecs.Categorize(labels=["a", "b"], dtype="<U1"),)
+
+
+def test_parse_filters() -> None:
+    """
+    Test that parse_filters accepts None, a single codec, or any iterable of codecs and
+    dict representations of codecs, and rejects everything else.
+    """
+    codec = numcodecs.Zlib(level=1)
+    assert parse_filters(None) is None
+    assert parse_filters(codec) == (codec,)
+    assert parse_filters([]) is None
+    assert parse_filters(iter([codec, {"id": "zlib", "level": 1}])) == (codec, codec)
+    with pytest.raises(TypeError, match="Invalid filters"):
+        parse_filters(1)
+    with pytest.raises(TypeError, match="Invalid filter at index 1"):
+        parse_filters([codec, 1])
+
+
+@pytest.mark.parametrize("dtype_str", ["|S4", "|V4"])
+def test_from_dict_bytes_fill_value(dtype_str: str) -> None:
+    """
+    Test that base64-encoded fill values of bytes dtypes round-trip through to_dict / from_dict.
+    """
+    metadata = ArrayV2Metadata(
+        shape=(8,), dtype=dtype_str, chunks=(8,), fill_value=b"\x01\x02\x03\x04", order="C"
+    )
+    data = metadata.to_dict()
+    assert data["fill_value"] == "AQIDBA=="
+    assert ArrayV2Metadata.from_dict(data) == metadata
@@ -355,6 +355,17 @@ def test_parse_invalid_dtype_raises(data):
         DataType.parse(data)
 
 
+@pytest.mark.parametrize("dtype_str", [*bool_dtypes, *int_dtypes, *float_dtypes, *complex_dtypes])
+def test_parse_numpy_dtype(dtype_str: str) -> None:
+    assert DataType.parse(np.dtype(dtype_str)) == DataType(dtype_str)
+
+
+@pytest.mark.parametrize("data", [np.dtype(">f8"), np.dtype("datetime64[s]")])
+def test_parse_invalid_numpy_dtype_raises(data: np.dtype[Any]) -> None:
+    with pytest.raises(ValueError, match=r"Invalid Zarr format 3 data_type: .*"):
+        DataType.parse(data)
+
+
 @pytest.mark.parametrize(
     ("data_type", "fill_value"), [("uint8", -1), ("int32", 22.5), ("float32", "foo")]
 )
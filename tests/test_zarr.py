@@ -9,3 +9,32 @@ def test_exports() -> None:
 
     for export in __all__:
         getattr(zarr, export)
+
+
+def test_lazy_exports() -> None:
+    """
+    Ensure that ``import zarr`` does not import the array, group and API modules, while the
+    public names and subpackages stay reachable from the ``zarr`` namespace.
+    """
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, zarr; "
+        "assert 'zarr.api.synchronous' not in sys.modules; "
+        "assert 'zarr.core.group' not in sys.modules; "
+        "assert 'storage' in dir(zarr); "
+        "zarr.create; "
+        "assert 'zarr.api.synchronous' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+    code = (
+        "import zarr; "
+        "zarr.storage.MemoryStore(); "
+        "zarr.api.asynchronous.open; "
+        "assert 'storage' in dir(zarr)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+    for name in ("Any", "TYPE_CHECKING", "annotations", "import_module"):
+        assert not hasattr(zarr, name)
+        assert name not in dir(zarr)